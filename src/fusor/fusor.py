@@ -1,8 +1,14 @@
 """Module for modifying fusion objects."""
 
+import asyncio
 import logging
 import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import cached_property
+from typing import Any
 
+from biocommons.seqrepo.seqrepo import SeqRepo
 from bioutils.accessions import coerce_namespace
 from cool_seq_tool.app import CoolSeqTool
 from cool_seq_tool.schemas import CoordinateType, Strand
@@ -51,6 +57,49 @@ from fusor.tools import get_error_message, translate_identifier
 
 _logger = logging.getLogger(__name__)
 
+_CURIE_RE = re.compile(CURIE.__metadata__[0].pattern)
+_PROTEIN_AC_RE = re.compile(r"^(?:np_|ensp)", re.IGNORECASE)
+_REFGET_ACCESSION_RE = re.compile(r"^ga4gh:SQ\.[0-9A-Za-z_\-]{32}$")
+_FUSION_TYPE_VALUES = FusionType.values()
+_MULTIPLE_POSSIBLE_GENES_ELEMENT = StructuralElementType.MULTIPLE_POSSIBLE_GENES_ELEMENT
+_UNKNOWN_GENE_ELEMENT = StructuralElementType.UNKNOWN_GENE_ELEMENT
+_FUSION_CONSTRUCTORS = {
+    FusionType.CATEGORICAL_FUSION: "categorical_fusion",
+    FusionType.ASSAYED_FUSION: "assayed_fusion",
+}
+_CACHE_MAX_SIZE = 4096
+_TRANSLATION_FAILED = object()
+
+
+def _get_cached(cache: OrderedDict, key: tuple) -> Any:  # noqa: ANN401
+    """Look up a value in one of the per-instance lookup caches.
+
+    Hits are marked as most recently used, so they are the last to be evicted.
+
+    :param cache: cache to check
+    :param key: lookup key
+    :return: cached value, or ``None`` if not present
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_result(cache: OrderedDict, key: tuple, value: Any) -> None:  # noqa: ANN401
+    """Store a value in one of the per-instance lookup caches.
+
+    Once a cache holds ``_CACHE_MAX_SIZE`` entries, the least recently used entry is
+    evicted so that long-lived FUSOR instances don't grow without bound.
+
+    :param cache: cache to update
+    :param key: lookup key
+    :param value: value to store
+    """
+    cache[key] = value
+    if len(cache) > _CACHE_MAX_SIZE:
+        cache.popitem(last=False)
+
 
 class FUSOR:
     """Class for modifying fusion objects."""
@@ -62,33 +111,60 @@ class FUSOR:
     ) -> None:
         """Initialize FUSOR class.
 
+        If not provided, the gene normalizer database and Cool-Seq-Tool instance are
+        only created the first time a method needs them.
+
         :param cool_seq_tool: Cool-Seq-Tool instance
         :param gene_database: gene normalizer database instance
         """
+        self._gene_database = gene_database
+        self._cool_seq_tool = cool_seq_tool
+
+        self._gene_cache: OrderedDict[
+            tuple[str, bool], tuple[Gene | None, str | None]
+        ] = OrderedDict()
+        self._location_digest_cache: OrderedDict[
+            tuple[int | None, int | None, str], str
+        ] = OrderedDict()
+        self._translation_cache: OrderedDict[tuple[str, str], CURIE | object] = (
+            OrderedDict()
+        )
+
+    @cached_property
+    def gene_normalizer(self) -> QueryHandler:
+        """Gene normalizer query handler, created on first access."""
+        gene_database = self._gene_database
         if not gene_database:
             gene_database = create_db()
-        self.gene_normalizer = QueryHandler(gene_database)
+        return QueryHandler(gene_database)
+
+    @cached_property
+    def cool_seq_tool(self) -> CoolSeqTool:
+        """Cool-Seq-Tool instance, created on first access."""
+        if not self._cool_seq_tool:
+            return CoolSeqTool()
+        return self._cool_seq_tool
 
-        if not cool_seq_tool:
-            cool_seq_tool = CoolSeqTool()
-        self.cool_seq_tool = cool_seq_tool
-        self.seqrepo = self.cool_seq_tool.seqrepo_access.sr
+    @cached_property
+    def seqrepo(self) -> SeqRepo:
+        """SeqRepo instance used by Cool-Seq-Tool."""
+        return self.cool_seq_tool.seqrepo_access.sr
 
     @staticmethod
-    def _contains_element_type(kwargs: dict, elm_type: StructuralElementType) -> bool:
-        """Check if fusion contains element of a specific type. Helper method for
+    def _get_element_types(kwargs: dict) -> set[str]:
+        """Collect the types of all elements in a fusion's structure. Helper method for
         inferring fusion type.
 
         :param kwargs: keyword args given to fusion method
-        :param elm_type: element type to match
-        :return: True if at least one element of given type is found, False otherwise.
+        :return: set of element type values found in the structure
         """
-        for c in kwargs["structure"]:
-            if (isinstance(c, dict) and c.get("type") == elm_type) or (
-                isinstance(c, BaseStructuralElement) and c.type == elm_type
-            ):
-                return True
-        return False
+        element_types = set()
+        for c in kwargs.get("structure", []):
+            if isinstance(c, dict):
+                element_types.add(c.get("type"))
+            elif isinstance(c, BaseStructuralElement):
+                element_types.add(c.type)
+        return element_types
 
     def fusion(self, fusion_type: FusionType | None = None, **kwargs) -> Fusion:
         """Construct fusion object.
@@ -96,6 +172,10 @@ class FUSOR:
         Fusion type (assayed vs categorical) can be inferred based on provided kwargs,
         assuming they can sufficiently discriminate the type.
 
+        Callers that already know which kind of fusion they are building can use
+        :py:meth:`assayed_fusion` or :py:meth:`categorical_fusion` directly, which
+        skips type inference and keyword argument forwarding.
+
         :param fusion_type: explicitly specify fusion type. Unnecessary if providing
             fusion object in keyword args that includes ``type`` attribute.
         :return: constructed fusion object if successful
@@ -105,7 +185,7 @@ class FUSOR:
         # try explicit type param
         explicit_type = kwargs.get("type")
         if not fusion_type and explicit_type:
-            if explicit_type in FusionType.values():
+            if explicit_type in _FUSION_TYPE_VALUES:
                 fusion_type = explicit_type
                 kwargs.pop("type")
             else:
@@ -113,31 +193,22 @@ class FUSOR:
                 raise FUSORParametersException(msg)
         fusion_fn = None
         if fusion_type:
-            if fusion_type == FusionType.CATEGORICAL_FUSION:
-                fusion_fn = self.categorical_fusion
-            elif fusion_type == FusionType.ASSAYED_FUSION:
-                fusion_fn = self.assayed_fusion
-            else:
+            fusion_fn_name = _FUSION_CONSTRUCTORS.get(fusion_type)
+            if fusion_fn_name is None:
                 msg = f"Invalid fusion_type parameter: {fusion_type}"
                 raise FUSORParametersException(msg)
+            fusion_fn = getattr(self, fusion_fn_name)
         else:
             # try to infer from provided attributes
-            categorical_attributes = any(
-                [
-                    "critical_functional_domains" in kwargs,
-                    self._contains_element_type(
-                        kwargs, StructuralElementType.MULTIPLE_POSSIBLE_GENES_ELEMENT
-                    ),
-                ]
+            element_types = self._get_element_types(kwargs)
+            categorical_attributes = (
+                "critical_functional_domains" in kwargs
+                or _MULTIPLE_POSSIBLE_GENES_ELEMENT in element_types
             )
-            assayed_attributes = any(
-                [
-                    "causative_event" in kwargs,
-                    "assay" in kwargs,
-                    self._contains_element_type(
-                        kwargs, StructuralElementType.UNKNOWN_GENE_ELEMENT
-                    ),
-                ]
+            assayed_attributes = (
+                "causative_event" in kwargs
+                or "assay" in kwargs
+                or _UNKNOWN_GENE_ELEMENT in element_types
             )
             if categorical_attributes and assayed_attributes:
                 msg = "Received conflicting attributes"
@@ -265,7 +336,7 @@ class FUSOR:
                 **kwargs
             )
         else:
-            if "genomic_ac" in kwargs and kwargs.get("genomic_ac") is None:
+            if "genomic_ac" in kwargs and kwargs["genomic_ac"] is None:
                 msg = (
                     "`genomic_ac` is required when going from genomic to"
                     " transcript exon coordinates"
@@ -319,6 +390,46 @@ class FUSOR:
             None,
         )
 
+    async def transcript_segment_elements(
+        self, segments: Iterable[dict], **kwargs
+    ) -> list[tuple[TranscriptSegmentElement | None, list[str] | None]]:
+        """Create several transcript segment elements concurrently.
+
+        The coordinate lookups for each segment are independent, so they are awaited
+        together rather than one after another.
+
+        :param segments: Keyword arguments for each call to
+            :py:meth:`transcript_segment_element`
+        :param kwargs: Keyword arguments shared by every segment. Values given in
+            ``segments`` take precedence.
+        :return: Transcript Segment Element and warning for each segment, in the order
+            given
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.transcript_segment_element(**{**kwargs, **segment})
+                    for segment in segments
+                )
+            )
+        )
+
+    def prefetch_genes(
+        self, queries: Iterable[str], use_minimal_gene: bool = True
+    ) -> None:
+        """Normalize a batch of gene terms ahead of element construction.
+
+        Normalized genes are cached on this instance, so element builders called
+        afterward with the same terms (and the same ``use_minimal_gene`` value) don't
+        query the gene normalizer again.
+
+        :param queries: gene terms to normalize
+        :param use_minimal_gene: ``True`` if minimal gene object (``id``, ``label``)
+            will be used. ``False`` if gene-normalizer's gene object will be used
+        """
+        for query in dict.fromkeys(queries):
+            self._normalized_gene(query, use_minimal_gene=use_minimal_gene)
+
     def gene_element(
         self, gene: str, use_minimal_gene: bool = True
     ) -> tuple[GeneElement | None, str | None]:
@@ -332,7 +443,8 @@ class FUSOR:
         """
         gene_resp = self._normalized_gene(gene, use_minimal_gene=use_minimal_gene)
         if gene_resp[0]:
-            return GeneElement(gene=gene_resp[0]), None
+            # gene descriptor comes straight from the normalizer, so skip revalidation
+            return GeneElement.model_construct(gene=gene_resp[0]), None
         return None, gene_resp[1]
 
     def templated_sequence_element(
@@ -366,6 +478,11 @@ class FUSOR:
             seq_id_target_namespace=seq_id_target_namespace,
         )
 
+        if isinstance(strand, Strand):
+            # region is built by _sequence_location, so neither field needs validation
+            return TemplatedSequenceElement.model_construct(
+                region=region, strand=strand
+            )
         return TemplatedSequenceElement(region=region, strand=strand)
 
     @staticmethod
@@ -380,11 +497,10 @@ class FUSOR:
         """
         try:
             upper_seq = sequence.upper()
-            seq = SequenceString(upper_seq)
             linker_sequence = LiteralSequenceExpression(
-                sequence=seq, id=f"fusor.sequence:{sequence}"
+                sequence=SequenceString(upper_seq), id=f"fusor.sequence:{upper_seq}"
             )
-            return LinkerElement(linkerSequence=linker_sequence), None
+            return LinkerElement.model_construct(linkerSequence=linker_sequence), None
         except ValidationError as e:
             msg = str(e)
             _logger.warning(msg)
@@ -396,7 +512,7 @@ class FUSOR:
 
         :return: MultiplePossibleGenesElement
         """
-        return MultiplePossibleGenesElement()
+        return MultiplePossibleGenesElement.model_construct()
 
     @staticmethod
     def unknown_gene_element() -> UnknownGeneElement:
@@ -404,7 +520,7 @@ class FUSOR:
 
         :return: Unknown Gene element
         """
-        return UnknownGeneElement()
+        return UnknownGeneElement.model_construct()
 
     def functional_domain(
         self,
@@ -434,10 +550,7 @@ class FUSOR:
         :return: Tuple with FunctionalDomain and None value for warnings if
             successful, or a None value and warning message if unsuccessful
         """
-        sequence_id_lower = sequence_id.lower()
-        if not (sequence_id_lower.startswith("np_")) or (
-            sequence_id_lower.startswith("ensp")
-        ):
+        if not _PROTEIN_AC_RE.match(sequence_id):
             msg = "Sequence_id must be a protein accession."
             _logger.warning(msg)
             return None, msg
@@ -521,33 +634,90 @@ class FUSOR:
         :param sequence_id: Accession for sequence
         :param seq_id_target_namespace: If want to use digest for ``sequence_id``, set
             this to the namespace you want the digest for. Otherwise, leave as ``None``.
+        :return: VRS Sequence Location. A well-formed ``ga4gh:SQ.`` refget accession
+            given as ``sequence_id`` is used as is, without checking it against
+            SeqRepo.
+        :raise: IDTranslationException if unable to get a refget accession for
+            ``sequence_id``
         """
-        sequence_id = self._get_coerced_sequence_id(
-            sequence_id, seq_id_target_namespace
-        )
-
-        refget_accession = translate_identifier(self.seqrepo, sequence_id)
+        if sequence_id.startswith("ga4gh:SQ.") and (
+            not seq_id_target_namespace or seq_id_target_namespace == "ga4gh"
+        ):
+            # already a refget accession, so there is nothing to coerce or
+            # look up in SeqRepo
+            coerced_sequence_id = sequence_id
+        else:
+            coerced_sequence_id = self._get_coerced_sequence_id(
+                sequence_id, seq_id_target_namespace
+            )
+        if coerced_sequence_id.startswith("ga4gh:SQ."):
+            # already translated to the refget accession, e.g. when
+            # seq_id_target_namespace is "ga4gh"
+            if not _REFGET_ACCESSION_RE.match(coerced_sequence_id):
+                raise IDTranslationException
+            refget_accession = coerced_sequence_id
+        else:
+            refget_accession = self._translate_identifier(coerced_sequence_id)
 
         sequence_location = SequenceLocation(
             start=start,
             end=end,
             sequenceReference=SequenceReference(
-                id=sequence_id, refgetAccession=refget_accession.replace("ga4gh:", "")
+                id=coerced_sequence_id,
+                refgetAccession=refget_accession.removeprefix("ga4gh:"),
             ),
         )
-        sequence_location_id = ga4gh_identify(sequence_location)
-        sequence_location.id = sequence_location_id
 
+        sequence_location.id = self._identify_location(sequence_location)
         return sequence_location
 
+    def _identify_location(self, sequence_location: SequenceLocation) -> CURIE:
+        """Return GA4GH identifier for a sequence location, reusing the digest of a
+        previously identified location with the same coordinates and sequence
+
+        :param sequence_location: VRS Sequence Location. Its ``digest`` is set unless
+            it already has a ``digest`` or a valid GA4GH ``id``.
+        :return: GA4GH identifier
+        """
+        start = sequence_location.start
+        end = sequence_location.end
+        sequence_reference = sequence_location.sequenceReference
+        if (
+            sequence_location.digest
+            # ga4gh_identify returns a valid preset GA4GH id without computing a digest
+            or sequence_location.has_valid_ga4gh_id()
+            or not isinstance(sequence_reference, SequenceReference)
+            or not isinstance(start, int | None)
+            or not isinstance(end, int | None)
+        ):
+            return ga4gh_identify(sequence_location)
+
+        # digest only depends on coordinates and refget accession, and a preset
+        # digest lets ga4gh_identify skip serializing and hashing the location
+        digest_key = (start, end, sequence_reference.refgetAccession)
+        digest = _get_cached(self._location_digest_cache, digest_key)
+        if digest is not None:
+            sequence_location.digest = digest
+            return ga4gh_identify(sequence_location)
+
+        sequence_location_id = ga4gh_identify(sequence_location)
+        if sequence_location.digest is not None:
+            _cache_result(
+                self._location_digest_cache, digest_key, sequence_location.digest
+            )
+        return sequence_location_id
+
     @staticmethod
-    def _location_id(location: dict) -> CURIE:
+    def _location_id(location: SequenceLocation | dict) -> CURIE:
         """Return GA4GH digest for location
 
-        :param location: VRS Location represented as a dict
+        :param location: VRS Sequence Location, or a VRS Location represented as a
+            dict
         :return: GA4GH digest
         """
-        return ga4gh_identify(models.Location(**location))
+        if isinstance(location, dict):
+            location = models.Location(**location).root
+        return ga4gh_identify(location)
 
     def _normalized_gene(
         self, query: str, use_minimal_gene: bool | None = None
@@ -559,15 +729,27 @@ class FUSOR:
         :return: Tuple with gene and None value for warnings if
             successful, and None value with warning string if unsuccessful
         """
-        gene_norm_resp = self.gene_normalizer.normalize(query)
-        if gene_norm_resp.match_type:
-            gene = gene_norm_resp.gene
-            gene_id = gene_norm_resp.normalized_id
-            if use_minimal_gene:
-                return Gene(id=gene_id, label=gene.label), None
-            gene.id = gene_id
-            return gene, None
-        return None, f"gene-normalizer unable to normalize {query}"
+        cache_key = (query, bool(use_minimal_gene))
+        cached = _get_cached(self._gene_cache, cache_key)
+        if cached is None:
+            gene_norm_resp = self.gene_normalizer.normalize(query)
+            if gene_norm_resp.match_type:
+                gene = gene_norm_resp.gene
+                gene_id = gene_norm_resp.normalized_id
+                if use_minimal_gene:
+                    cached = Gene(id=gene_id, label=gene.label), None
+                else:
+                    gene.id = gene_id
+                    cached = gene, None
+            else:
+                cached = None, f"gene-normalizer unable to normalize {query}"
+            _cache_result(self._gene_cache, cache_key, cached)
+
+        gene, warning = cached
+        if gene:
+            # cached genes are shared, so give each caller a copy it can modify
+            gene = gene.model_copy(deep=True)
+        return gene, warning
 
     def _add_ids_to_sequence_location(
         self,
@@ -584,10 +766,35 @@ class FUSOR:
         seq_ref_id = self._get_coerced_sequence_id(genomic_ac, seq_id_target_namespace)
 
         if sequence_location:
-            sequence_location.id = ga4gh_identify(sequence_location)
+            sequence_location.id = self._identify_location(sequence_location)
             if sequence_location.sequenceReference:
                 sequence_location.sequenceReference.id = seq_ref_id
 
+    def _translate_identifier(self, ac: str, target_namespace: str = "ga4gh") -> CURIE:
+        """Return ``target_namespace`` identifier for accession provided.
+
+        Translations, including failed ones, are cached on this instance, since they
+        don't change for a given SeqRepo snapshot.
+
+        :param ac: Identifier accession
+        :param target_namespace: The namespace of identifiers to return
+        :return: Identifier for ``target_namespace``
+        :raise: IDTranslationException if unable to perform desired translation
+        """
+        cache_key = (ac, target_namespace)
+        translated = _get_cached(self._translation_cache, cache_key)
+        if translated is None:
+            try:
+                translated = translate_identifier(
+                    self.seqrepo, ac, target_namespace=target_namespace
+                )
+            except IDTranslationException:
+                translated = _TRANSLATION_FAILED
+            _cache_result(self._translation_cache, cache_key, translated)
+        if translated is _TRANSLATION_FAILED:
+            raise IDTranslationException
+        return translated
+
     def _get_coerced_sequence_id(
         self, sequence_id: str, seq_id_target_namespace: str | None = None
     ) -> str:
@@ -599,13 +806,13 @@ class FUSOR:
         try:
             sequence_id = coerce_namespace(sequence_id)
         except ValueError:
-            if not re.match(CURIE.__metadata__[0].pattern, sequence_id):
+            if not _CURIE_RE.match(sequence_id):
                 sequence_id = f"sequence.id:{sequence_id}"
 
         if seq_id_target_namespace:
             try:
-                seq_id = translate_identifier(
-                    self.seqrepo, sequence_id, target_namespace=seq_id_target_namespace
+                seq_id = self._translate_identifier(
+                    sequence_id, target_namespace=seq_id_target_namespace
                 )
             except IDTranslationException:
                 _logger.warning(
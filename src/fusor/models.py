@@ -2,6 +2,7 @@
 
 from abc import ABC
 from enum import Enum
+from functools import cache
 from typing import Annotated, Any, Literal
 
 from cool_seq_tool.schemas import Strand
@@ -517,9 +518,10 @@ class FusionType(str, Enum):
     ASSAYED_FUSION = FUSORTypes.ASSAYED_FUSION.value
 
     @classmethod
-    def values(cls) -> set:
+    @cache
+    def values(cls) -> frozenset[str]:
         """Provide all possible enum values."""
-        return {c.value for c in cls}
+        return frozenset(c.value for c in cls)
 
 
 class AbstractFusion(BaseModel, ABC):
@@ -152,7 +152,6 @@ def generate_nomenclature(fusion: Fusion, sr: SeqRepo) -> str:
         should be impossible thanks to Pydantic validation.
     """
     parts = []
-    element_genes = []
     if fusion.regulatoryElement:
         parts.append(reg_element_nomenclature(fusion.regulatoryElement, sr))
     for element in fusion.structure:
@@ -163,17 +162,11 @@ def generate_nomenclature(fusion: Fusion, sr: SeqRepo) -> str:
         elif isinstance(element, LinkerElement):
             parts.append(element.linkerSequence.sequence.root)
         elif isinstance(element, TranscriptSegmentElement):
-            if not any(
-                [gene == element.gene.label for gene in element_genes]  # noqa: C419
-            ):
-                parts.append(tx_segment_nomenclature(element))
+            parts.append(tx_segment_nomenclature(element))
         elif isinstance(element, TemplatedSequenceElement):
             parts.append(templated_seq_nomenclature(element, sr))
         elif isinstance(element, GeneElement):
-            if not any(
-                [gene == element.gene.label for gene in element_genes]  # noqa: C419
-            ):
-                parts.append(gene_nomenclature(element))
+            parts.append(gene_nomenclature(element))
         else:
             raise ValueError
     if (
@@ -64,6 +64,45 @@ def fusor_instance():
     return FUSOR(cool_seq_tool=cst)
 
 
+@pytest.fixture()
+def no_gene_normalizer(fusor_instance, monkeypatch):
+    """Provide a callable that makes any further gene normalizer query fail the test.
+
+    Used to check that lookups are served from ``fusor_instance``'s caches.
+    """
+
+    def _fail_normalize(query):
+        msg = f"gene normalizer queried again for {query}"
+        raise AssertionError(msg)
+
+    def _disable():
+        monkeypatch.setattr(
+            fusor_instance.gene_normalizer, "normalize", _fail_normalize
+        )
+
+    return _disable
+
+
+@pytest.fixture()
+def no_seqrepo_translation(fusor_instance, monkeypatch):
+    """Provide a callable that makes any further SeqRepo identifier translation fail
+    the test.
+
+    Used to check that lookups are served from ``fusor_instance``'s caches.
+    """
+
+    def _fail_translate(identifier, target_namespaces=None):
+        msg = f"seqrepo queried again for {identifier} ({target_namespaces})"
+        raise AssertionError(msg)
+
+    def _disable():
+        monkeypatch.setattr(
+            fusor_instance.seqrepo, "translate_identifier", _fail_translate
+        )
+
+    return _disable
+
+
 @pytest.fixture(scope="session")
 def translator_instance():
     """Create test fixture for translator object"""
@@ -1,12 +1,14 @@
 """Module for testing the FUSOR class."""
 
 import copy
+from collections import OrderedDict
 
 import pytest
 from cool_seq_tool.schemas import Strand
 from ga4gh.core.domain_models import Gene
 from ga4gh.vrs.models import SequenceLocation
 
+from fusor import fusor
 from fusor.exceptions import FUSORParametersException, IDTranslationException
 from fusor.models import (
     AssayedFusion,
@@ -40,7 +42,7 @@ def linker_element():
     """Create linker element test fixture."""
     params = {
         "linkerSequence": {
-            "id": "fusor.sequence:act",
+            "id": "fusor.sequence:ACT",
             "sequence": "ACT",
             "type": "LiteralSequenceExpression",
         },
@@ -319,6 +321,42 @@ def test__normalized_gene(fusor_instance):
     assert resp[1] == "gene-normalizer unable to normalize B R A F"
 
 
+def test__normalized_gene_cache(fusor_instance, no_gene_normalizer):
+    """Test that repeated _normalized_gene queries are served from the cache."""
+    resp = fusor_instance._normalized_gene("BRAF", use_minimal_gene=True)
+    fusor_instance._normalized_gene("B R A F")
+    no_gene_normalizer()
+    assert fusor_instance._normalized_gene("BRAF", use_minimal_gene=True) == resp
+    assert fusor_instance._normalized_gene("B R A F") == (
+        None,
+        "gene-normalizer unable to normalize B R A F",
+    )
+
+
+def test__normalized_gene_cache_copies(fusor_instance):
+    """Test that changes to a returned gene don't leak into later lookups."""
+    for minimal in (True, False):
+        gene = fusor_instance._normalized_gene("BRAF", use_minimal_gene=minimal)[0]
+        expected = gene.model_dump()
+        gene.label = "modified"
+        gene.id = "hgnc:0"
+        gene.extensions = None
+        resp = fusor_instance._normalized_gene("BRAF", use_minimal_gene=minimal)
+        assert resp[0].model_dump() == expected
+
+
+def test__cache_result(monkeypatch):
+    """Test that lookup caches evict the least recently used entry."""
+    monkeypatch.setattr(fusor, "_CACHE_MAX_SIZE", 2)
+    cache = OrderedDict()
+    fusor._cache_result(cache, ("a",), 1)
+    fusor._cache_result(cache, ("b",), 2)
+    assert fusor._get_cached(cache, ("a",)) == 1
+    fusor._cache_result(cache, ("c",), 3)
+    assert list(cache) == [("a",), ("c",)]
+    assert fusor._get_cached(cache, ("b",)) is None
+
+
 def test_fusion(
     fusor_instance,
     linker_element,
@@ -598,6 +636,41 @@ async def test_transcript_segment_element(
     assert tsg[0].model_dump() == mane_transcript_segment_element.model_dump()
 
 
+@pytest.mark.asyncio()
+async def test_transcript_segment_elements(
+    fusor_instance, transcript_segment_element, mane_transcript_segment_element
+):
+    """Test that transcript_segment_elements method works correctly"""
+    tsgs = await fusor_instance.transcript_segment_elements(
+        [
+            {
+                "transcript": "NM_152263.3",
+                "exon_start": 1,
+                "exon_end": 8,
+                "tx_to_genomic_coords": True,
+            },
+            {
+                "genomic_ac": "NC_000011.10",
+                "seg_start_genomic": 9575887,
+                "gene": "WEE1",
+            },
+            {"genomic_ac": None},
+        ],
+        tx_to_genomic_coords=False,
+    )
+    assert len(tsgs) == 3
+    assert tsgs[0][0].model_dump() == transcript_segment_element.model_dump()
+    assert tsgs[0][1] is None
+    assert tsgs[1][0].model_dump() == mane_transcript_segment_element.model_dump()
+    assert tsgs[1][1] is None
+    assert tsgs[2] == (
+        None,
+        [
+            "`genomic_ac` is required when going from genomic to transcript exon coordinates"
+        ],
+    )
+
+
 def test_gene_element(fusor_instance, braf_gene_obj_min, braf_gene_obj):
     """Test that gene_element works correctly."""
     gc = fusor_instance.gene_element("BRAF", use_minimal_gene=True)
@@ -617,6 +690,19 @@ def test_gene_element(fusor_instance, braf_gene_obj_min, braf_gene_obj):
     assert gc[1] == "gene-normalizer unable to normalize BRA F"
 
 
+def test_prefetch_genes(fusor_instance, braf_gene_obj_min, no_gene_normalizer):
+    """Test that prefetched genes are reused by element builders."""
+    fusor_instance.prefetch_genes(["BRAF", "BRAF", "BRA F"])
+    no_gene_normalizer()
+    gc = fusor_instance.gene_element("BRAF", use_minimal_gene=True)
+    assert isinstance(gc[0], GeneElement)
+    compare_gene_obj(gc[0].gene.model_dump(), braf_gene_obj_min.model_dump())
+
+    gc = fusor_instance.gene_element("BRA F", use_minimal_gene=True)
+    assert gc[0] is None
+    assert gc[1] == "gene-normalizer unable to normalize BRA F"
+
+
 def test_templated_sequence_element(
     fusor_instance,
     templated_sequence_element,
@@ -654,6 +740,83 @@ def test_templated_sequence_element(
         )
 
 
+def test__sequence_location_cache(fusor_instance, no_seqrepo_translation):
+    """Test that repeated sequence locations reuse cached translations and digests."""
+    loc = fusor_instance._sequence_location(99, 150, "NC_000001.11")
+    assert loc.id == "ga4gh:SL.U7-HtnKxK9kKI1ZINiDM_m4I6O-p4Dc9"
+    no_seqrepo_translation()
+    cached_loc = fusor_instance._sequence_location(99, 150, "NC_000001.11")
+    assert cached_loc.model_dump() == loc.model_dump()
+
+
+def test__identify_location_preset_id(fusor_instance, templated_sequence_element):
+    """Test that only locations with a valid preset GA4GH ID skip the digest cache."""
+    region = templated_sequence_element.region.model_copy(
+        update={"start": 1, "end": 2, "digest": None}
+    )
+    assert fusor_instance._identify_location(region) == region.id
+    digest_key = (1, 2, region.sequenceReference.refgetAccession)
+    assert digest_key not in fusor_instance._location_digest_cache
+
+    # ga4gh_identify computes the digest for any other preset ID
+    region = templated_sequence_element.region.model_copy(
+        update={"start": 3, "end": 4, "id": "ga4gh:SL.foo", "digest": None}
+    )
+    location_id = fusor_instance._identify_location(region)
+    assert location_id == f"ga4gh:SL.{region.digest}"
+    digest_key = (3, 4, region.sequenceReference.refgetAccession)
+    assert fusor_instance._location_digest_cache[digest_key] == region.digest
+
+
+def test__sequence_location_refget_accession(
+    fusor_instance, templated_sequence_element, no_seqrepo_translation
+):
+    """Test that refget accessions are used without a SeqRepo lookup."""
+    no_seqrepo_translation()
+    loc = fusor_instance._sequence_location(
+        99, 150, "ga4gh:SQ.Ya6Rs7DHhDeg7YaOSg1EoNi3U_nQ9SvO"
+    )
+    assert loc.id == templated_sequence_element.region.id
+    assert loc.sequenceReference.id == "ga4gh:SQ.Ya6Rs7DHhDeg7YaOSg1EoNi3U_nQ9SvO"
+    assert (
+        loc.sequenceReference.refgetAccession == "SQ.Ya6Rs7DHhDeg7YaOSg1EoNi3U_nQ9SvO"
+    )
+
+    # malformed refget accession
+    with pytest.raises(IDTranslationException):
+        fusor_instance._sequence_location(99, 150, "ga4gh:SQ.bogus")
+
+
+def test__location_id(templated_sequence_element):
+    """Test that _location_id method works correctly."""
+    region = templated_sequence_element.region.model_copy(
+        update={"id": None, "digest": None}
+    )
+    expected = "ga4gh:SL.U7-HtnKxK9kKI1ZINiDM_m4I6O-p4Dc9"
+    assert fusor.FUSOR._location_id(region) == expected
+    assert (
+        fusor.FUSOR._location_id(region.model_dump(exclude={"id", "digest"}))
+        == expected
+    )
+
+
+def test__translate_identifier_cache(fusor_instance, no_seqrepo_translation):
+    """Test that translations, including failed ones, are cached."""
+    assert (
+        fusor_instance._translate_identifier("refseq:NM_152263.3")
+        == "ga4gh:SQ.ijXOSP3XSsuLWZhXQ7_TJ5JXu4RJO6VT"
+    )
+    with pytest.raises(IDTranslationException):
+        fusor_instance._translate_identifier("refseq:NM_BOGUS.1")
+    no_seqrepo_translation()
+    assert (
+        fusor_instance._translate_identifier("refseq:NM_152263.3")
+        == "ga4gh:SQ.ijXOSP3XSsuLWZhXQ7_TJ5JXu4RJO6VT"
+    )
+    with pytest.raises(IDTranslationException):
+        fusor_instance._translate_identifier("refseq:NM_BOGUS.1")
+
+
 def test_linker_element(fusor_instance, linker_element):
     """Test that linker_element method works correctly."""
     lc = fusor_instance.linker_element("act")
@@ -777,6 +940,35 @@ def test_functional_domain(
     assert cd[0] is None
     assert "Sequence_id must be a protein accession." in cd[1]
 
+    # Ensembl protein accessions pass the protein accession check
+    cd = fusor_instance.functional_domain(
+        "preserved",
+        "Serine-threonine/tyrosine-protein kinase, catalytic domain",
+        "interpro:IPR001245",
+        "BRAF",
+        "ENSP00000493543.1",
+        458,
+        712,
+        use_minimal_gene=True,
+    )
+    assert cd[1] is None
+    assert isinstance(cd[0], FunctionalDomain)
+    assert cd[0].id == functional_domain_min.id
+    assert cd[0].label == functional_domain_min.label
+    assert cd[0].status == functional_domain_min.status
+    compare_gene_obj(
+        cd[0].associatedGene.model_dump(),
+        functional_domain_min.associatedGene.model_dump(),
+    )
+    # same sequence as NP_004324.2, so only the sequence reference ID differs
+    expected_sl = functional_domain_min.sequenceLocation
+    assert cd[0].sequenceLocation.id == expected_sl.id
+    assert cd[0].sequenceLocation.sequenceReference.id == "ensembl:ENSP00000493543.1"
+    assert (
+        cd[0].sequenceLocation.sequenceReference.refgetAccession
+        == expected_sl.sequenceReference.refgetAccession
+    )
+
     # check for recognized protein accession
     accession = "NP_9999.999"
     cd = fusor_instance.functional_domain(